@@ -0,0 +1,165 @@
+"""Plotly figures for the dashboard.
+
+Figures are built from a view's frame and its status summary, once per
+snapshot and view, and shared by every session showing that view. Sessions
+must not modify them. plotly is imported lazily, off the first-paint path.
+"""
+
+STATUS_COLORS = {
+    'Completed': '#48bb78',
+    'In Progress': '#ed8936',
+    'To Do': '#4299e1',
+    'Pending': '#f56565'
+}
+
+PIE_COLORS = ['#48bb78', '#ed8936', '#4299e1', '#f56565', '#9f7aea', '#38b2ac']
+
+
+def status_pie(status_counts):
+    import plotly.express as px
+
+    fig = px.pie(
+        values=status_counts.values,
+        names=status_counts.index,
+        color_discrete_sequence=PIE_COLORS
+    )
+    fig.update_traces(textposition='inside', textinfo='percent+label', textfont_size=12)
+    fig.update_layout(showlegend=True, height=400, margin=dict(t=40, b=40))
+    return fig
+
+
+def status_breakdown(stats):
+    import pandas as pd
+    import plotly.express as px
+
+    status_data = pd.DataFrame({
+        'Status': ['Completed', 'In Progress', 'To Do', 'Pending'],
+        'Count': [stats['completed'], stats['in_progress'], stats['todo'], stats['pending']]
+    })
+    fig = px.bar(
+        status_data,
+        x='Status',
+        y='Count',
+        color='Status',
+        color_discrete_map=STATUS_COLORS,
+        text='Count'
+    )
+    fig.update_traces(texttemplate='%{text}', textposition='outside')
+    fig.update_layout(showlegend=False, height=400, margin=dict(t=40, b=40))
+    return fig
+
+
+def completion_funnel(stats):
+    import pandas as pd
+    import plotly.express as px
+
+    funnel_data = pd.DataFrame({
+        'Stage': ['Total Tasks', 'In Progress', 'Completed'],
+        'Count': [stats['total_tasks'], stats['in_progress'], stats['completed']]
+    })
+    fig = px.funnel(
+        funnel_data,
+        x='Count',
+        y='Stage',
+        color='Stage',
+        color_discrete_sequence=['#667eea', '#ed8936', '#48bb78']
+    )
+    fig.update_layout(height=350, margin=dict(t=40, b=40))
+    return fig
+
+
+def goal_gauge(stats):
+    import plotly.graph_objects as go
+
+    goal_target = stats['total_tasks']
+    goal_achieved = stats['completed']
+    goal_percentage = (goal_achieved / goal_target * 100) if goal_target > 0 else 0
+
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number+delta",
+        value=goal_percentage,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': "Completion %", 'font': {'size': 20}},
+        delta={'reference': 75, 'increasing': {'color': "#48bb78"}},
+        gauge={
+            'axis': {'range': [None, 100], 'tickwidth': 1, 'tickcolor': "darkblue"},
+            'bar': {'color': "#667eea"},
+            'bgcolor': "white",
+            'borderwidth': 2,
+            'bordercolor': "gray",
+            'steps': [
+                {'range': [0, 50], 'color': '#f56565'},
+                {'range': [50, 75], 'color': '#ed8936'},
+                {'range': [75, 100], 'color': '#48bb78'}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 90
+            }
+        }
+    ))
+    fig.update_layout(height=350, margin=dict(t=40, b=40))
+    return fig
+
+
+# statuses in page order; a status missing from the counts has no rows
+def status_timeline(statuses, status_counts):
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    for status in statuses:
+        count = int(status_counts.get(status, 0))
+        fig.add_trace(go.Bar(
+            name=status,
+            x=[status],
+            y=[count],
+            text=[count],
+            textposition='auto',
+            marker_color=STATUS_COLORS.get(status, '#667eea'),
+            hovertemplate=f'<b>{status}</b><br>Tasks: %{{y}}<extra></extra>'
+        ))
+
+    fig.update_layout(
+        barmode='group',
+        height=350,
+        showlegend=True,
+        xaxis_title="Status Category",
+        yaxis_title="Number of Tasks",
+        hovermode='x unified',
+        margin=dict(t=40, b=40)
+    )
+    return fig
+
+
+# Binned from the status counts rather than the rows, so the figure does not
+# carry one value per task to the browser
+def status_heatmap(status_counts):
+    import pandas as pd
+    import plotly.express as px
+
+    counts = pd.DataFrame({'Status': status_counts.index.astype(str), 'Count': status_counts.values})
+    fig = px.density_heatmap(
+        counts,
+        x='Status',
+        z='Count',
+        histfunc='sum',
+        color_continuous_scale='Viridis'
+    )
+    fig.update_layout(height=300, margin=dict(t=40, b=40))
+    return fig
+
+
+# Every figure on the page for one view, keyed by name; the heatmap is None
+# for sheets with Priority or Category columns, which it does not cover yet
+def figures(frame, stats, statuses):
+    status_counts = frame['Status'].value_counts()
+    has_dimensions = 'Priority' in frame.columns or 'Category' in frame.columns
+    return {
+        'pie': status_pie(status_counts),
+        'bar': status_breakdown(stats),
+        'funnel': completion_funnel(stats),
+        'gauge': goal_gauge(stats),
+        'timeline': status_timeline(statuses, status_counts),
+        'heatmap': None if has_dimensions else status_heatmap(status_counts),
+    }
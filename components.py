@@ -0,0 +1,256 @@
+"""HTML components for the dashboard.
+
+Markup lives in templates here instead of inline f-strings in app.py. Each
+fragment is cached by its inputs, so a rerun with unchanged data reuses the
+same strings instead of rebuilding them.
+"""
+import re
+from functools import lru_cache
+from pathlib import Path
+from string import Template
+
+import streamlit as st
+
+ASSETS_DIR = Path(__file__).parent / "assets"
+
+# Templates
+METRIC_CARD = Template("""<div class="metric-card $variant">
+<div class="metric-label">$label</div>
+<div class="metric-value">$value</div>
+</div>""")
+
+STATS_CONTAINER = Template("""<div class="stats-container">
+$body
+</div>""")
+
+PROGRESS_OVERVIEW = Template("""<h4>📊 Overall Progress</h4>
+<p>You've completed <strong>$completed</strong> out of <strong>$total</strong> tasks ($percentage%)</p>
+<div class="progress-bar">
+<div class="progress-fill" style="width: ${width}%;"></div>
+</div>""")
+
+TASK_CARD = Template("""<div class="task-card">
+<div class="task-row">
+<div class="task-body">
+<div class="task-title">$emoji $task</div>
+<div class="task-description">$description</div>
+</div>
+<div>
+<span class="status-badge $status_class">$status</span>
+</div>
+</div>
+</div>""")
+
+CHAT_MESSAGE = Template("""<div class="chat-message $css_class">
+<strong>$speaker</strong> $message
+</div>""")
+
+SUMMARY_REPORT = Template("""<h4>📊 Performance Summary</h4>
+<p><strong>Total Tasks:</strong> $total_tasks</p>
+<p><strong>Completed Tasks:</strong> $completed ($completion_percentage%)</p>
+<p><strong>In Progress:</strong> $in_progress tasks</p>
+<p><strong>To Do:</strong> $todo tasks</p>
+<p><strong>Pending:</strong> $pending tasks</p>
+<hr>
+<p><strong>Productivity Score:</strong> $productivity_score/100</p>
+<p><strong>Task Velocity:</strong> $velocity $velocity_unit</p>
+<p><strong>Work Balance:</strong> $distribution_score% optimal distribution</p>$delivery""")
+
+RECOMMENDATIONS = """<h4>💡 Recommendations</h4>
+<ul>
+<li>Focus on completing in-progress tasks</li>
+<li>Prioritize high-value pending items</li>
+<li>Maintain steady task velocity</li>
+<li>Balance workload across statuses</li>
+<li>Review and update task descriptions</li>
+</ul>"""
+
+TROUBLESHOOTING = Template("""<h5>Common Issues:</h5>
+<ol>
+<li><strong>Sheet not accessible:</strong> Ensure sharing settings allow public access</li>
+<li><strong>Wrong sheet ID:</strong> Verify the sheet ID in the URL</li>
+<li><strong>Network issues:</strong> Check your internet connection</li>
+<li><strong>API limits:</strong> Google Sheets may have rate limits</li>
+</ol>
+<p><strong>Current Sheet ID:</strong> $sheet_id</p>""")
+
+SKELETON = """<div class="skeleton">
+<div class="skeleton-row">
+<div class="skeleton-block skeleton-card"></div>
+<div class="skeleton-block skeleton-card"></div>
+<div class="skeleton-block skeleton-card"></div>
+<div class="skeleton-block skeleton-card"></div>
+</div>
+<div class="skeleton-block skeleton-wide"></div>
+<div class="skeleton-block skeleton-wide"></div>
+</div>"""
+
+FOOTER = """<div class="dashboard-footer">
+<h4>🚀 Advanced Task Management System</h4>
+<p>🔗 <strong>Connected to Google Sheets</strong> | 🔄 Auto-refreshes every 60 seconds | 💬 AI-Powered Chat Assistant</p>
+<p>🔔 <strong>Webhook Integration:</strong> Real-time notifications enabled</p>
+<p class="footer-note">
+Built with Streamlit • Powered by Plotly • Data updates in real-time<br>
+📊 Analytics Dashboard • 🤖 AI Assistant • 🔗 Webhook Integration
+</p>
+</div>"""
+
+
+# Stylesheet, read and minified once per process
+@lru_cache(maxsize=1)
+def stylesheet():
+    css = (ASSETS_DIR / "dashboard.css").read_text(encoding="utf-8")
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{}:;,])\s*", r"\1", css)
+    return f"<style>{css.strip()}</style>"
+
+
+# Streamlit drops any element a rerun does not emit again, so the stylesheet
+# has to go out on every run; it is kept as small as possible instead.
+def inject_styles():
+    st.markdown(stylesheet(), unsafe_allow_html=True)
+
+
+def html(fragment):
+    st.markdown(fragment, unsafe_allow_html=True)
+
+
+@lru_cache(maxsize=64)
+def metric_card(label, value, variant=""):
+    return METRIC_CARD.substitute(label=label, value=value, variant=variant)
+
+
+@lru_cache(maxsize=64)
+def stats_container(body):
+    return STATS_CONTAINER.substitute(body=body)
+
+
+@lru_cache(maxsize=32)
+def insight_header(title, caption):
+    return stats_container(f"<h5>{title}</h5>\n<p>{caption}</p>")
+
+
+@lru_cache(maxsize=32)
+def progress_overview(completed, total, percentage):
+    return stats_container(PROGRESS_OVERVIEW.substitute(
+        completed=completed,
+        total=total,
+        percentage=f"{percentage:.1f}",
+        width=percentage,
+    ))
+
+
+@lru_cache(maxsize=4096)
+def task_card(task, description, status, status_class, emoji):
+    return TASK_CARD.substitute(
+        task=task,
+        description=description,
+        status=status,
+        status_class=status_class,
+        emoji=emoji,
+    )
+
+
+# Joins the cards of one status group so the group is sent as one element
+def task_list(cards):
+    return "\n".join(task_card(*card) for card in cards)
+
+
+# Badge class for a status; missing statuses count as pending
+@lru_cache(maxsize=64)
+def status_class(status):
+    if not isinstance(status, str):
+        return 'status-pending'
+    status = status.lower()
+    if 'completed' in status or 'complete' in status:
+        return 'status-completed'
+    elif 'progress' in status:
+        return 'status-progress'
+    elif 'to do' in status or 'todo' in status:
+        return 'status-todo'
+    else:
+        return 'status-pending'
+
+
+@lru_cache(maxsize=64)
+def status_emoji(status):
+    if not isinstance(status, str):
+        return '⏳'
+    status = status.lower()
+    if 'completed' in status or 'complete' in status:
+        return '✅'
+    elif 'progress' in status:
+        return '🔄'
+    elif 'to do' in status or 'todo' in status:
+        return '📝'
+    else:
+        return '⏳'
+
+
+# Task cards of a frame grouped by status, in the frame's order, as
+# [(expander label, html)]
+def task_groups(frame):
+    groups = []
+    for status in frame['Status'].unique():
+        rows = frame[frame['Status'] == status]
+        cards = []
+        for task, description, task_status in zip(rows['Task'], rows['Description'], rows['Status']):
+            task = task if isinstance(task, str) else 'Untitled Task'
+            description = description if isinstance(description, str) else 'No description provided'
+            task_status = task_status if isinstance(task_status, str) else 'Pending'
+            cards.append((task, description, task_status, status_class(task_status), status_emoji(task_status)))
+        groups.append((f"{status_emoji(status)} {status} ({len(rows)} tasks)", task_list(cards)))
+    return groups
+
+
+@lru_cache(maxsize=256)
+def chat_message(role, message):
+    if role == 'user':
+        return CHAT_MESSAGE.substitute(css_class="user-message", speaker="You:", message=message)
+    return CHAT_MESSAGE.substitute(css_class="bot-message", speaker="🤖 Assistant:", message=message)
+
+
+@lru_cache(maxsize=32)
+def summary_report(total_tasks, completed, in_progress, todo, pending,
+                   completion_percentage, productivity_score, velocity, velocity_unit, distribution_score,
+                   avg_age_days=None, overdue=None, cycle_days=None):
+    delivery = ""
+    if avg_age_days is not None:
+        delivery += f"\n<p><strong>Average Age:</strong> {avg_age_days:.1f} days for open tasks</p>"
+    if overdue is not None:
+        delivery += f"\n<p><strong>Overdue:</strong> {overdue} open tasks past their due date</p>"
+    if cycle_days is not None:
+        delivery += f"\n<p><strong>Cycle Time:</strong> {cycle_days:.1f} days median from created to completed</p>"
+    if delivery:
+        delivery = "\n<hr>" + delivery
+    return stats_container(SUMMARY_REPORT.substitute(
+        total_tasks=total_tasks,
+        completed=completed,
+        in_progress=in_progress,
+        todo=todo,
+        pending=pending,
+        completion_percentage=f"{completion_percentage:.1f}",
+        productivity_score=f"{productivity_score:.0f}",
+        velocity=f"{velocity:.1f}",
+        velocity_unit=velocity_unit.replace("/", " per "),
+        distribution_score=f"{distribution_score:.0f}",
+        delivery=delivery,
+    ))
+
+
+def recommendations():
+    return stats_container(RECOMMENDATIONS)
+
+
+def troubleshooting(sheet_id):
+    return stats_container(TROUBLESHOOTING.substitute(sheet_id=sheet_id))
+
+
+# Placeholder shown while the heavy modules and the data load
+def skeleton():
+    return SKELETON
+
+
+def footer():
+    return FOOTER
@@ -0,0 +1,166 @@
+"""Resilient sheet fetching.
+
+One SheetFetcher per process decides when the snapshot needs refreshing and
+makes sure only one fetch is in flight at a time. Once there is a snapshot to
+serve, refreshes run on a background thread, along with building the new
+snapshot's derived artifacts, so no rerun waits on them. When a fetch fails,
+the last good snapshot (in memory, or on disk from a previous run) keeps
+being served and marked stale. A background thread retries with exponential
+backoff, so an outage does not turn every session's rerun into another
+request to Google.
+"""
+import logging
+import random
+import threading
+import time
+
+import pipeline
+import schema
+import snapshot
+
+logger = logging.getLogger(__name__)
+
+BACKOFF_BASE = 5
+BACKOFF_MAX = 300
+
+# A snapshot this many TTLs old is marked stale even with no failed fetch yet,
+# e.g. while a refresh hangs
+STALE_AFTER_TTLS = 2
+
+
+class SheetFetcher:
+    def __init__(self, url, ttl):
+        self.url = url
+        self.ttl = ttl
+        self.last_report = None
+        self.last_error = None
+        self.failures = 0
+        self.next_retry_at = None
+        self._fetch_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._retry_thread = None
+
+    # Frame to render; a snapshot older than the TTL is served as is while a
+    # refresh runs in the background. None only when there has never been a
+    # successful load
+    def get(self):
+        frame, _ = snapshot.latest()
+        if frame is None:
+            # Nothing to serve yet; fetch now, or wait for the fetch in flight
+            with self._fetch_lock:
+                # The fetch we waited on may have just loaded the snapshot, or
+                # failed and started a backoff
+                if snapshot.latest()[0] is None and not self.in_backoff():
+                    self._fetch()
+            return snapshot.latest()[0]
+
+        if self._due():
+            self._refresh_in_background()
+        return frame
+
+    # Fetch now, waiting for it, and cut any backoff short; for a manual refresh
+    def refresh(self):
+        with self._state_lock:
+            self.next_retry_at = None
+        with self._fetch_lock:
+            self._fetch()
+
+    def in_backoff(self):
+        with self._state_lock:
+            return self.next_retry_at is not None and time.time() < self.next_retry_at
+
+    # Staleness details for the UI
+    def status(self):
+        _, fetched_at = snapshot.latest()
+        age = snapshot.age()
+        overdue = age is not None and age >= STALE_AFTER_TTLS * self.ttl
+        with self._state_lock:
+            failing = self.failures > 0
+            return {
+                'stale': (failing or overdue) and fetched_at is not None,
+                'failing': failing,
+                'fetched_at': fetched_at,
+                'last_error': self.last_error,
+                'retry_in': max(0.0, self.next_retry_at - time.time()) if self.next_retry_at else None,
+            }
+
+    def _due(self):
+        age = snapshot.age()
+        return (age is None or age >= self.ttl) and not self.in_backoff()
+
+    def _refresh_in_background(self):
+        # Someone else is already fetching
+        if not self._fetch_lock.acquire(blocking=False):
+            return
+
+        def refresh():
+            try:
+                # A fetch may have finished between the caller's check and the lock
+                if self._due():
+                    self._fetch()
+            finally:
+                self._fetch_lock.release()
+
+        threading.Thread(target=refresh, name="tasker-sheet-refresh", daemon=True).start()
+
+    def _fetch(self):
+        import requests
+
+        try:
+            with requests.get(self.url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                # urllib3 would close the stream at EOF, before the parser's final read
+                response.raw.auto_close = False
+                df, report = schema.read_tasks(response.raw)
+            fetched_at = time.time()
+            # Sessions keep reading the previous artifacts until these are
+            # done; the snapshot is only committed once they are, so a failed
+            # build is retried like a failed fetch
+            pipeline.publish(df, fetched_at)
+        except Exception as e:
+            self._record_failure(e)
+            return False
+
+        snapshot.save(df, fetched_at)
+        with self._state_lock:
+            self.last_report = report
+            self.last_error = None
+            self.failures = 0
+            self.next_retry_at = None
+        return True
+
+    def _record_failure(self, error):
+        with self._state_lock:
+            self.failures += 1
+            self.last_error = str(error)
+            # Jitter keeps several processes from retrying in lockstep
+            delay = BACKOFF_BASE * 2 ** (self.failures - 1) * random.uniform(0.8, 1.2)
+            delay = min(BACKOFF_MAX, delay)
+            self.next_retry_at = time.time() + delay
+            start_retrying = self._retry_thread is None or not self._retry_thread.is_alive()
+            if start_retrying:
+                self._retry_thread = threading.Thread(target=self._retry_loop, name="tasker-sheet-retry", daemon=True)
+        logger.warning("Sheet fetch failed (%d in a row), retrying in %.0fs: %s", self.failures, delay, error)
+        if start_retrying:
+            self._retry_thread.start()
+
+    def _retry_loop(self):
+        while True:
+            with self._state_lock:
+                if self.failures == 0:
+                    return
+                wait = (self.next_retry_at or 0) - time.time()
+            if wait > 0:
+                time.sleep(min(wait, 1.0))
+                continue
+            with self._fetch_lock:
+                # A session or a manual refresh may have succeeded meanwhile,
+                # or failed and pushed the next retry out
+                with self._state_lock:
+                    if self.failures == 0:
+                        return
+                    due = self.next_retry_at is None or time.time() >= self.next_retry_at
+                if not due:
+                    continue
+                self._fetch()
@@ -0,0 +1,257 @@
+"""Load test for the dashboard.
+
+Drives N concurrent simulated sessions through Streamlit's AppTest against a
+local sheet stub and a stub webhook, then reports rerun latency percentiles,
+memory per session and outbound request counts.
+
+    python loadtest.py --sessions 50 --reruns 5 --rows 20000
+
+All sessions share one process, as they would on a single `streamlit run`
+server, so process-wide caches and snapshots are shared between them.
+"""
+import argparse
+import importlib
+import json
+import os
+import random
+import resource
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+APP_PATH = Path(__file__).parent / "app.py"
+
+STATUSES = ("Completed", "In Progress", "To Do", "Pending")
+
+
+def make_sheet(rows, assignees=25, projects=8, seed=0):
+    rng = random.Random(seed)
+    lines = ["Task,Description,Status,Assignee,Project"]
+    for i in range(rows):
+        lines.append(
+            f"Task {i},Generated description for task {i},{rng.choice(STATUSES)},"
+            f"user{rng.randrange(assignees)},project{rng.randrange(projects)}"
+        )
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+class Counters:
+    def __init__(self):
+        self.sheet_fetches = 0
+        self.webhook_posts = 0
+        self._lock = threading.Lock()
+
+    def add(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+
+# Serves the sheet CSV on GET and acknowledges webhook POSTs
+def start_stubs(sheet, counters, sheet_delay=0.0):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            counters.add("sheet_fetches")
+            if sheet_delay:
+                time.sleep(sheet_delay)
+            self.send_response(200)
+            self.send_header("Content-Type", "text/csv")
+            self.send_header("Content-Length", str(len(sheet)))
+            self.end_headers()
+            self.wfile.write(sheet)
+
+        def do_POST(self):
+            counters.add("webhook_posts")
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            body = json.dumps({"response": "ok"}).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, name="loadtest-stubs", daemon=True).start()
+    return server
+
+
+# Current resident set size in MB (Linux), falling back to the peak
+def rss_mb():
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+# AppTest assumes one session at a time. Each run installs a mock Runtime
+# singleton and clears it when it ends, which breaks any session still
+# running, and compiles the script with a fresh ScriptCache, which is not safe
+# to do from several threads at once. Keep the last mock runtime visible
+# between runs and share one script cache, as a real server does.
+def adapt_apptest_for_concurrency():
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+
+    last = {}
+
+    def instance(cls):
+        if cls._instance is not None:
+            last["runtime"] = cls._instance
+        elif "runtime" not in last:
+            raise RuntimeError("Runtime hasn't been created!")
+        return cls._instance or last["runtime"]
+
+    def exists(cls):
+        return cls._instance is not None or "runtime" in last
+
+    Runtime.instance = classmethod(instance)
+    Runtime.exists = classmethod(exists)
+
+    shared_cache = ScriptCache()
+    compile_script = ScriptCache.get_bytecode
+    ScriptCache.get_bytecode = lambda self, script_path: compile_script(shared_cache, script_path)
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+# One simulated viewer: initial load, then reruns, optionally chatting
+def run_session(number, args, latencies, errors, start_barrier):
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(str(APP_PATH), default_timeout=args.timeout)
+    # The real auto-refresh sleeps inside the script run; the harness paces reruns itself
+    app.session_state["auto_refresh"] = False
+    start_barrier.wait()
+
+    for rerun in range(args.reruns):
+        started = time.perf_counter()
+        try:
+            if args.chat_every and rerun and rerun % args.chat_every == 0:
+                app.text_input(key="chat_input").set_value(f"Status update please ({number}/{rerun})")
+                app.button[[b.label for b in app.button].index("📤 Send")].click()
+            app.run()
+        except Exception as e:
+            errors.append(f"session {number}: {e}")
+            return
+        latencies.append(time.perf_counter() - started)
+        if app.exception:
+            errors.append(f"session {number}: {app.exception[0].value}")
+            return
+        if args.think:
+            time.sleep(random.uniform(0, args.think))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=20, help="concurrent simulated sessions")
+    parser.add_argument("--reruns", type=int, default=5, help="script runs per session, including the first")
+    parser.add_argument("--rows", type=int, default=2000, help="rows in the stub sheet")
+    parser.add_argument("--think", type=float, default=0.0, help="max random pause between reruns, in seconds")
+    parser.add_argument("--chat-every", type=int, default=0, help="send a chat message every N reruns (0 disables)")
+    parser.add_argument("--sheet-delay", type=float, default=0.0, help="simulated sheet fetch latency, in seconds")
+    parser.add_argument("--timeout", type=float, default=120.0, help="per-run AppTest timeout, in seconds")
+    parser.add_argument("--json", dest="json_path", help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    counters = Counters()
+    server = start_stubs(make_sheet(args.rows), counters, args.sheet_delay)
+    stub_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    # Point the app at the stubs and at a throwaway snapshot before it is imported
+    os.environ["TASKER_SHEET_URL"] = f"{stub_url}/sheet.csv"
+    os.environ["TASKER_WEBHOOK_URL"] = f"{stub_url}/webhook"
+    os.environ["TASKER_SNAPSHOT_PATH"] = str(Path(tempfile.mkdtemp(prefix="tasker-loadtest-")) / "snapshot.pkl")
+    sys.path.insert(0, str(APP_PATH.parent))
+
+    adapt_apptest_for_concurrency()
+
+    # Modules every session shares are imported up front so they are not
+    # counted as per-session memory
+    import warmup
+    for name in warmup.HEAVY_MODULES:
+        importlib.import_module(name)
+
+    # One session up front loads the snapshot and builds its artifacts, which
+    # every session shares, so the baseline leaves them out as well
+    latencies, errors = [], []
+    warmup_args = argparse.Namespace(**{**vars(args), "reruns": 1, "chat_every": 0, "think": 0.0})
+    run_session("warm-up", warmup_args, [], errors, threading.Barrier(1))
+    if errors:
+        print(f"warm-up session failed: {errors[0]}")
+        server.shutdown()
+        return 1
+
+    baseline = rss_mb()
+    start_barrier = threading.Barrier(args.sessions)
+    threads = [
+        threading.Thread(target=run_session, args=(n, args, latencies, errors, start_barrier), name=f"session-{n}")
+        for n in range(args.sessions)
+    ]
+    peak = baseline
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    while any(thread.is_alive() for thread in threads):
+        peak = max(peak, rss_mb())
+        time.sleep(0.05)
+    elapsed = time.perf_counter() - started
+    server.shutdown()
+
+    results = {
+        "sessions": args.sessions,
+        "reruns": args.reruns,
+        "rows": args.rows,
+        "elapsed_s": elapsed,
+        "runs": len(latencies),
+        "runs_per_s": len(latencies) / elapsed if elapsed else 0.0,
+        "latency_ms": {
+            "p50": percentile(latencies, 0.50) * 1000,
+            "p90": percentile(latencies, 0.90) * 1000,
+            "p99": percentile(latencies, 0.99) * 1000,
+            "max": max(latencies, default=0.0) * 1000,
+        },
+        "memory_mb": {
+            "baseline": baseline,
+            "peak": peak,
+            "per_session": (peak - baseline) / args.sessions,
+        },
+        "outbound": {
+            "sheet_fetches": counters.sheet_fetches,
+            "webhook_posts": counters.webhook_posts,
+        },
+        "errors": errors,
+    }
+
+    latency = results["latency_ms"]
+    memory = results["memory_mb"]
+    print(f"{args.sessions} sessions x {args.reruns} reruns, {args.rows} rows, {elapsed:.1f}s "
+          f"({results['runs_per_s']:.1f} runs/s)")
+    print(f"rerun latency ms  p50 {latency['p50']:.0f}  p90 {latency['p90']:.0f}  "
+          f"p99 {latency['p99']:.0f}  max {latency['max']:.0f}")
+    print(f"memory MB  baseline {memory['baseline']:.0f}  peak {memory['peak']:.0f}  "
+          f"per session {memory['per_session']:.1f}")
+    print(f"outbound  sheet fetches {counters.sheet_fetches}  webhook posts {counters.webhook_posts}")
+    if errors:
+        print(f"{len(errors)} session(s) failed, first: {errors[0]}")
+
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(results, indent=2))
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""Status counts and delivery metrics for a snapshot.
+
+Per-row inputs (status flags, dates) are extracted once per snapshot.
+Summaries are computed with vectorized numpy operations over a tenant's row
+positions and cached per tenant and day, so a rerun reads them without
+scanning the frame. Age and overdue depend on the current date, which is why
+the day is part of the cache key.
+"""
+import threading
+from datetime import date
+
+# Same matching rules the dashboard has always used for status buckets
+COMPLETED_PATTERN = 'Completed|Complete'
+PROGRESS_PATTERN = 'Progress'
+TODO_PATTERN = 'To Do|todo'
+
+DATE_COLUMNS = ("Created", "Due", "Completed On")
+
+# Weeks averaged for throughput, ending with the current week
+THROUGHPUT_WEEKS = 8
+
+
+# Boolean array of rows whose status matches pattern; categoricals are
+# matched once per category instead of once per row
+def _status_matches(status, pattern):
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(status.dtype, pd.CategoricalDtype):
+        matches = status.cat.categories.to_series().str.contains(pattern, case=False, na=False).to_numpy(dtype=bool)
+        codes = status.cat.codes.to_numpy()
+        if not len(matches):
+            return np.zeros(len(status), dtype=bool)
+        return np.where(codes >= 0, matches[codes], False)
+    return status.str.contains(pattern, case=False, na=False).to_numpy(dtype=bool)
+
+
+# Monday-based week number of datetime64 values (1970-01-01 was a Thursday)
+def _week_numbers(values):
+    return (values.astype("datetime64[D]").astype("int64") + 3) // 7
+
+
+class TaskMetrics:
+    def __init__(self, frame):
+        import numpy as np
+
+        status = frame['Status']
+        self.completed = _status_matches(status, COMPLETED_PATTERN)
+        self.in_progress = _status_matches(status, PROGRESS_PATTERN)
+        self.todo = _status_matches(status, TODO_PATTERN)
+
+        self.dates = {}
+        for column in DATE_COLUMNS:
+            if column in frame.columns and frame[column].notna().any():
+                self.dates[column] = frame[column].to_numpy(dtype="datetime64[ns]")
+
+        if "Created" in self.dates and "Completed On" in self.dates:
+            cycle = self.dates["Completed On"] - self.dates["Created"]
+            self.cycle_days = cycle / np.timedelta64(1, "D")
+        else:
+            self.cycle_days = None
+
+        self._summaries = {}
+        self._lock = threading.Lock()
+
+    @property
+    def has_dates(self):
+        return bool(self.dates)
+
+    # Summary for a tenant's rows (positions None means all rows), cached per day
+    def summary(self, tenant, positions=None, today=None):
+        today = today or date.today()
+        key = (tenant, today)
+        with self._lock:
+            cached = self._summaries.get(key)
+        if cached is not None:
+            return cached
+
+        result = self._summarize(positions, today)
+        with self._lock:
+            # Yesterday's summaries are stale; drop them
+            if any(day != today for _, day in self._summaries):
+                self._summaries = {k: v for k, v in self._summaries.items() if k[1] == today}
+            self._summaries[key] = result
+        return result
+
+    def _summarize(self, positions, today):
+        import numpy as np
+
+        def rows(values):
+            return values if positions is None else values[positions]
+
+        completed = rows(self.completed)
+        total_tasks = len(completed)
+        result = {
+            'total_tasks': total_tasks,
+            'completed': int(completed.sum()),
+            'in_progress': int(rows(self.in_progress).sum()),
+            'todo': int(rows(self.todo).sum()),
+        }
+        result['pending'] = total_tasks - result['completed'] - result['in_progress'] - result['todo']
+
+        result.update(avg_age_days=None, overdue=None, overdue_rate=None,
+                      cycle_days=None, throughput_per_week=None, weekly_throughput=None)
+        # Ages and due dates are compared by calendar day; a task created
+        # later today is 0 days old, not a fraction of a day in the future
+        now = np.datetime64(today, "D")
+        open_tasks = ~completed
+
+        if "Created" in self.dates:
+            created = rows(self.dates["Created"])[open_tasks]
+            created = created[~np.isnat(created)]
+            if len(created):
+                age = (now - created.astype("datetime64[D]")) / np.timedelta64(1, "D")
+                result['avg_age_days'] = float(np.clip(age, 0, None).mean())
+
+        if "Due" in self.dates:
+            due = rows(self.dates["Due"])[open_tasks]
+            due = due[~np.isnat(due)]
+            result['overdue'] = int((due.astype("datetime64[D]") < now).sum())
+            result['overdue_rate'] = (result['overdue'] / len(due) * 100) if len(due) else 0.0
+
+        if self.cycle_days is not None:
+            cycle = rows(self.cycle_days)
+            cycle = cycle[~np.isnan(cycle) & (cycle >= 0)]
+            if len(cycle):
+                result['cycle_days'] = float(np.median(cycle))
+
+        if "Completed On" in self.dates:
+            finished = rows(self.dates["Completed On"])
+            finished = finished[~np.isnat(finished)]
+            current_week = int(_week_numbers(np.array([now]))[0])
+            first_week = current_week - THROUGHPUT_WEEKS + 1
+            weeks = _week_numbers(finished)
+            weeks = weeks[(weeks >= first_week) & (weeks <= current_week)] - first_week
+            counts = np.bincount(weeks, minlength=THROUGHPUT_WEEKS)
+            result['weekly_throughput'] = counts.tolist()
+            result['throughput_per_week'] = float(counts.mean())
+
+        return result
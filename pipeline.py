@@ -0,0 +1,193 @@
+"""Derived artifacts of each snapshot, built off the rerun path.
+
+As soon as a snapshot is fetched (or loaded from disk), the cheap artifacts
+every page view needs are built on a worker pool: tenant indexes and
+metrics, statuses, figures and a search index. The finished set replaces the
+previous one in a single assignment, so a rerun reads either the old
+snapshot's artifacts or the new one's, never a mix, and never waits on the
+build. Artifacts whose size grows with the sheet (the sorted task list, its
+rendered cards and each export format) are built on first request instead,
+and tenant views the same way; all are then shared. Sessions must not modify
+them.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import charts
+import components
+import snapshot
+import views
+
+logger = logging.getLogger(__name__)
+
+WORKERS = 4
+
+# Views with more rows than this render their task cards in the rerun rather
+# than keeping a copy of the markup per snapshot
+TASK_CARDS_MAX_ROWS = 10_000
+
+# The task list's default order; with no search and every status selected,
+# the page shows the precomputed view
+DEFAULT_SORT = "Status"
+
+_executor = ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix="tasker-precompute")
+
+
+_EXPORTERS = {
+    'csv': lambda frame: frame.to_csv(index=False),
+    'json': lambda frame: frame.to_json(orient='records', indent=2, date_format='iso'),
+    'html': lambda frame: frame.to_html(index=False),
+}
+
+
+# Download payload of a frame in one of the export formats
+def export(frame, fmt):
+    return _EXPORTERS[fmt](frame).encode('utf-8')
+
+
+class Artifacts:
+    def __init__(self, frame, version):
+        self.frame = frame
+        self.version = version
+        self.views = views.TenantViews(frame, version)
+        self._results = {}
+        self._lock = threading.Lock()
+
+    # Build the cheap artifacts of the unfiltered page, in parallel
+    def build(self):
+        futures = [_executor.submit(self.summary, None)]
+        futures += [_executor.submit(self._get, name, None) for name in _EAGER]
+        for future in futures:
+            future.result()
+        return self
+
+    # Status counts and delivery metrics; cached per day by the metrics
+    def summary(self, tenant):
+        return self.views.summary(tenant)
+
+    # Distinct statuses of a view, in the order the page lists them
+    def statuses(self, tenant):
+        return self._get('statuses', tenant)
+
+    # A view's rows in the default sort order
+    def default_view(self, tenant):
+        return self._get('default_view', tenant)
+
+    def figures(self, tenant):
+        return self._get('figures', tenant)
+
+    # Rendered task cards of a view's default list; None for views too large
+    # to keep them, which the caller renders itself
+    def task_groups(self, tenant):
+        if len(self.views.frame_for(tenant)) > TASK_CARDS_MAX_ROWS:
+            return None
+        return self._get('task_groups', tenant)
+
+    # A view's default list in one export format, built on first download
+    def export(self, tenant, fmt):
+        return self._get(fmt, tenant)
+
+    # Rows of frame (any selection of this snapshot's rows) whose task or
+    # description contains term, ignoring case
+    def search(self, frame, term):
+        import pandas as pd
+
+        text = self._get('search_index', None)
+        positions = self.frame.index.get_indexer(frame.index)
+        hits = pd.Series(text[positions], copy=False).str.contains(term.lower(), regex=False)
+        return frame[hits.to_numpy(dtype=bool)]
+
+    # Each artifact is built once, by whichever thread asks first; others
+    # asking meanwhile wait for that build instead of repeating it
+    def _get(self, name, tenant):
+        key = (name, tenant)
+        with self._lock:
+            future = self._results.get(key)
+            building = future is None
+            if building:
+                future = self._results[key] = Future()
+        if building:
+            try:
+                future.set_result(_BUILDERS[name](self, tenant))
+            except BaseException as e:
+                # Let the next request try again
+                with self._lock:
+                    del self._results[key]
+                future.set_exception(e)
+        return future.result()
+
+
+def _statuses(artifacts, tenant):
+    return list(artifacts.views.frame_for(tenant)['Status'].unique())
+
+
+def _default_view(artifacts, tenant):
+    return artifacts.views.frame_for(tenant).sort_values(by=DEFAULT_SORT)
+
+
+def _figures(artifacts, tenant):
+    frame = artifacts.views.frame_for(tenant)
+    return charts.figures(frame, artifacts.summary(tenant), artifacts.statuses(tenant))
+
+
+def _task_groups(artifacts, tenant):
+    return components.task_groups(artifacts.default_view(tenant))
+
+
+def _exporter(fmt):
+    return lambda artifacts, tenant: export(artifacts.default_view(tenant), fmt)
+
+
+# Lower-cased task and description of every row, by position in the snapshot
+def _search_index(artifacts, tenant):
+    frame = artifacts.frame
+    text = frame['Task'].fillna('') + '\n' + frame['Description'].fillna('')
+    return text.str.lower().to_numpy(dtype=object)
+
+
+_BUILDERS = {
+    'statuses': _statuses,
+    'default_view': _default_view,
+    'figures': _figures,
+    'task_groups': _task_groups,
+    'search_index': _search_index,
+}
+_BUILDERS.update((fmt, _exporter(fmt)) for fmt in _EXPORTERS)
+
+# Built for every new snapshot; everything else waits for a request
+_EAGER = ('statuses', 'figures', 'search_index')
+
+_lock = threading.Lock()
+_build_lock = threading.Lock()
+_current = None
+
+
+# Build the artifacts of a snapshot and make them current; a snapshot older
+# than the current one is ignored
+def publish(frame, version):
+    global _current
+    with _build_lock:
+        current = _current
+        if current is not None and current.version >= version:
+            return current
+        started = time.perf_counter()
+        artifacts = Artifacts(frame, version).build()
+        with _lock:
+            _current = artifacts
+    logger.info("Built artifacts for %d rows in %.2fs", len(frame), time.perf_counter() - started)
+    return artifacts
+
+
+# Artifacts to render from; None until the first snapshot. Only the very
+# first run of a process can end up building them here
+def current():
+    with _lock:
+        artifacts = _current
+    if artifacts is not None:
+        return artifacts
+    frame, version = snapshot.latest()
+    if frame is None:
+        return None
+    return publish(frame, version)
@@ -0,0 +1,227 @@
+"""Declared schema for the task sheet and a streaming CSV parser for it.
+
+The export is read in chunks with explicit dtypes. Header names are matched
+to the declared columns by normalized name or alias, so a renamed or newly
+added column does not break the dashboard. Rows with more fields than the
+header are skipped and counted instead of failing the whole load. Short rows
+are kept with their missing trailing fields empty; once parsed they cannot
+be told apart from rows whose trailing cells are blank.
+"""
+import csv
+import io
+import re
+import warnings
+
+CHUNK_SIZE = 50_000
+
+# Catches surplus fields; the C parser only warns about long rows that do not
+# start a chunk and silently truncates the others
+_OVERFLOW = "__overflow__"
+
+DATE = "datetime64[ns]"
+
+
+class Column:
+    def __init__(self, name, dtype=str, required=False, aliases=()):
+        self.name = name
+        self.dtype = dtype
+        self.required = required
+        self.aliases = aliases
+
+
+SCHEMA = (
+    Column("Task", required=True, aliases=("task name", "title", "name")),
+    Column("Description", required=True, aliases=("details", "notes", "summary")),
+    Column("Status", dtype="category", required=True, aliases=("state", "task status")),
+    Column("Priority", dtype="category"),
+    Column("Category", dtype="category"),
+    Column("Assignee", dtype="category", aliases=("owner", "assigned to", "assigned")),
+    Column("Project", dtype="category", aliases=("team", "project name")),
+    Column("Created", dtype=DATE, aliases=("created at", "created on", "created date", "start date")),
+    Column("Due", dtype=DATE, aliases=("due date", "due on", "deadline")),
+    Column("Completed On", dtype=DATE, aliases=("completed at", "completed date", "completion date", "done date")),
+)
+
+
+class LoadReport:
+    def __init__(self):
+        self.rows = 0
+        self.skipped_rows = 0
+        self.renamed = {}
+        self.missing = []
+        self.extra = []
+
+    @property
+    def missing_required(self):
+        required = {column.name for column in SCHEMA if column.required}
+        return [name for name in self.missing if name in required]
+
+
+def _normalize(name):
+    return re.sub(r"[\s_\-]+", " ", str(name)).strip().casefold()
+
+
+_LOOKUP = {}
+for _column in SCHEMA:
+    for _alias in (_column.name,) + _column.aliases:
+        _LOOKUP[_normalize(_alias)] = _column
+
+
+# Map raw header names to schema columns; returns {raw: Column}. A header
+# matching a column's own name wins over one matching an alias, so a sheet
+# with both "Task" and "Name" keeps its real Task column
+def map_columns(header, report):
+    exact = {}
+    for raw in header:
+        column = _LOOKUP.get(_normalize(raw))
+        if column is not None and _normalize(raw) == _normalize(column.name):
+            exact.setdefault(column, raw)
+
+    mapping = {}
+    for raw in header:
+        column = _LOOKUP.get(_normalize(raw))
+        if column is not None and exact.get(column, raw) != raw:
+            column = None
+        if column is None or column in mapping.values():
+            report.extra.append(raw)
+            continue
+        mapping[raw] = column
+        if raw != column.name:
+            report.renamed[raw] = column.name
+    found = {column.name for column in mapping.values()}
+    report.missing = [column.name for column in SCHEMA if column.name not in found]
+    return mapping
+
+
+# Blank or repeated header cells would make read_csv reject the names
+def _unique_header(header):
+    seen = {}
+    unique = []
+    for position, raw in enumerate(header):
+        raw = raw.strip() or f"Unnamed: {position}"
+        if raw in seen:
+            seen[raw] += 1
+            raw = f"{raw}.{seen[raw]}"
+        else:
+            seen[raw] = 0
+        unique.append(raw)
+    return unique
+
+
+def _combine(parts, dtype):
+    import pandas as pd
+
+    if dtype == "category":
+        return pd.Series(pd.api.types.union_categoricals(parts, sort_categories=True), copy=False)
+    return pd.concat(parts, ignore_index=True, copy=False)
+
+
+# Parsed date strings shared across loads; a refreshed sheet mostly repeats
+# the dates of the previous one, so only new strings reach to_datetime
+_PARSED_DATES = {}
+_PARSED_DATES_LIMIT = 100_000
+
+
+# Parse a string column to datetimes, one to_datetime call per distinct value
+def _parse_dates(series):
+    import pandas as pd
+
+    values = series.astype("category")
+    categories = list(values.cat.categories)
+    if not categories:
+        return pd.Series(pd.NaT, index=series.index, dtype=DATE)
+
+    new = [value for value in categories if value not in _PARSED_DATES]
+    if new:
+        if len(_PARSED_DATES) + len(new) > _PARSED_DATES_LIMIT:
+            _PARSED_DATES.clear()
+        # Offsets are converted to UTC and dropped, so a sheet mixing time
+        # zones (or zoned and naive values) still yields naive datetimes
+        parsed = pd.to_datetime(pd.Index(new, dtype=object), errors="coerce", format="mixed", utc=True)
+        _PARSED_DATES.update(zip(new, parsed.tz_convert(None).as_unit("ns")))
+
+    # Unparseable values become NaT rather than dropping the row
+    lookup = pd.DatetimeIndex([_PARSED_DATES.get(value, pd.NaT) for value in categories]).as_unit("ns")
+    dates = lookup.take(values.cat.codes.to_numpy(), allow_fill=True, fill_value=pd.NaT)
+    return pd.Series(dates, index=series.index)
+
+
+# All-missing column; built from strings so categoricals get string categories
+def _empty(dtype, length):
+    import pandas as pd
+
+    return pd.Series(float("nan"), index=range(length), dtype=str).astype(dtype)
+
+
+# Parse a binary CSV stream into a frame conforming to SCHEMA
+def read_tasks(stream, chunk_size=CHUNK_SIZE):
+    import pandas as pd
+
+    report = LoadReport()
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        header = _unique_header(next(csv.reader(text)))
+    except StopIteration:
+        header = []
+
+    mapping = map_columns(header, report)
+    renames = {raw: column.name for raw, column in mapping.items()}
+    # An unmapped header named like a mapped column (say "task" next to a
+    # "Title" mapped to Task) is suffixed so the two do not collide
+    taken = set(header) | set(renames.values())
+    for raw in header:
+        if raw not in mapping and raw in renames.values():
+            suffix = 1
+            while f"{raw}.{suffix}" in taken:
+                suffix += 1
+            renames[raw] = f"{raw}.{suffix}"
+            taken.add(renames[raw])
+    names = [renames.get(raw, raw) for raw in header]
+    dtypes = {renames.get(raw, raw): (mapping[raw].dtype if raw in mapping else str) for raw in header}
+
+    # Columns are gathered per chunk and concatenated one at a time below, so
+    # the full frame never exists twice in memory
+    pieces = {name: [] for name in names}
+    if header:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always", pd.errors.ParserWarning)
+            reader = pd.read_csv(
+                text,
+                header=None,
+                names=header + [_OVERFLOW],
+                dtype=str,
+                index_col=False,
+                chunksize=chunk_size,
+                on_bad_lines="warn",
+            )
+            for chunk in reader:
+                malformed = chunk[_OVERFLOW].notna()
+                if malformed.any():
+                    report.skipped_rows += int(malformed.sum())
+                    chunk = chunk[~malformed]
+                chunk = chunk.rename(columns=renames)
+                report.rows += len(chunk)
+                for name in names:
+                    # Categoricals are built per chunk from strings so every
+                    # piece has categories of the same dtype
+                    series = chunk[name]
+                    if dtypes[name] == DATE:
+                        series = _parse_dates(series)
+                    elif dtypes[name] is not str:
+                        series = series.astype(dtypes[name])
+                    pieces[name].append(series)
+                del chunk
+        report.skipped_rows += sum(str(warning.message).count("Skipping line") for warning in caught)
+
+    data = {}
+    for name in names:
+        parts = pieces.pop(name)
+        data[name] = _combine(parts, dtypes[name]) if parts else _empty(dtypes[name], 0)
+        del parts
+
+    # Required columns the sheet lacks are added empty so downstream code can rely on them
+    for column in SCHEMA:
+        if column.name in report.missing_required:
+            data[column.name] = _empty(column.dtype, report.rows)
+
+    return pd.DataFrame(data, copy=False), report
@@ -0,0 +1,68 @@
+"""Last fetched copy of the sheet, kept in memory and on disk.
+
+The on-disk copy lets a freshly started process serve data without waiting
+on Google Sheets. pandas is imported lazily so importing this module stays
+cheap on the first-paint path.
+"""
+import os
+import threading
+import time
+from pathlib import Path
+
+SNAPSHOT_PATH = Path(os.environ.get(
+    "TASKER_SNAPSHOT_PATH",
+    Path(__file__).parent / ".cache" / "snapshot.pkl",
+))
+
+_lock = threading.Lock()
+_frame = None
+_fetched_at = None
+
+
+# Latest snapshot as (frame, fetched_at); (None, None) before anything is loaded
+def latest():
+    with _lock:
+        return _frame, _fetched_at
+
+
+# Age in seconds of the latest snapshot, or None if there is none
+def age():
+    with _lock:
+        if _fetched_at is None:
+            return None
+        return time.time() - _fetched_at
+
+
+# Store a freshly fetched frame in memory and persist it to disk; fetched_at
+# doubles as the snapshot's version
+def save(df, fetched_at):
+    global _frame, _fetched_at
+    with _lock:
+        _frame, _fetched_at = df, fetched_at
+    try:
+        SNAPSHOT_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = SNAPSHOT_PATH.with_suffix(".tmp")
+        df.to_pickle(tmp_path)
+        os.replace(tmp_path, SNAPSHOT_PATH)
+    except OSError:
+        # A read-only filesystem only costs us the warm start
+        pass
+    return fetched_at
+
+
+# Load the on-disk snapshot into memory; returns True if one was found
+def load_from_disk():
+    global _frame, _fetched_at
+    if not SNAPSHOT_PATH.exists():
+        return False
+    import pandas as pd
+    try:
+        df = pd.read_pickle(SNAPSHOT_PATH)
+        fetched_at = SNAPSHOT_PATH.stat().st_mtime
+    except Exception:
+        return False
+    with _lock:
+        # Never overwrite a fresher in-memory fetch with the disk copy
+        if _fetched_at is None or fetched_at > _fetched_at:
+            _frame, _fetched_at = df, fetched_at
+    return True
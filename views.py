@@ -0,0 +1,83 @@
+"""Per-tenant views of the current snapshot.
+
+A tenant is one value of an assignee or project column. The row positions of
+every tenant are computed once per snapshot, and each tenant's slice is built
+on first request and then shared by every session viewing it. Sessions only
+read these frames and must not modify them.
+"""
+import threading
+
+import streamlit as st
+
+import metrics
+
+TENANT_COLUMNS = ("Assignee", "Project")
+
+
+class TenantViews:
+    def __init__(self, frame, version):
+        self.frame = frame
+        self.version = version
+        self.indices = {}
+        self._slices = {}
+        self._lock = threading.Lock()
+        self.metrics = metrics.TaskMetrics(frame)
+
+        # One groupby pass per column yields the row positions of every tenant
+        for column in TENANT_COLUMNS:
+            if column not in frame.columns:
+                continue
+            groups = frame.groupby(column, observed=True, sort=True).indices
+            for value, positions in groups.items():
+                self.indices[(column, value)] = positions
+
+    def tenants(self):
+        return list(self.indices)
+
+    # Status counts and delivery metrics for a tenant's rows
+    def summary(self, tenant):
+        if tenant is None:
+            return self.metrics.summary(None)
+        return self.metrics.summary(tenant, self.indices.get(tenant, []))
+
+    # Rows visible to a tenant; None means everyone
+    def frame_for(self, tenant):
+        if tenant is None:
+            return self.frame
+        # A query parameter can name any value; only real tenants are cached
+        if tenant not in self.indices:
+            return self.frame.iloc[:0]
+        with self._lock:
+            view = self._slices.get(tenant)
+            if view is None:
+                view = self.frame.iloc[self.indices[tenant]]
+                # Unused categories would show up as empty slices in the charts
+                for column in view.select_dtypes("category").columns:
+                    view[column] = view[column].cat.remove_unused_categories()
+                self._slices[tenant] = view
+        return view
+
+
+def tenant_label(tenant):
+    if tenant is None:
+        return "Everyone"
+    column, value = tenant
+    return f"{column}: {value}"
+
+
+# A ?assignee= or ?project= query parameter pins the session to one tenant;
+# otherwise the viewer picks one in the sidebar
+def select_tenant(tenant_views):
+    for column in TENANT_COLUMNS:
+        value = st.query_params.get(column.lower())
+        if value is not None:
+            st.caption(f"👥 Viewing {tenant_label((column, value))}")
+            return (column, value)
+
+    if not tenant_views.tenants():
+        return None
+    return st.selectbox(
+        "👥 View tasks for:",
+        options=[None] + tenant_views.tenants(),
+        format_func=tenant_label,
+    )
@@ -0,0 +1,87 @@
+"""Process warm-up and startup timing.
+
+The first script run of a process starts a background thread that loads the
+on-disk snapshot, imports the heavy modules and precomputes the snapshot's
+artifacts, so the first viewer gets the page skeleton right away instead of
+waiting on pandas and plotly.
+"""
+import importlib
+import logging
+import threading
+import time
+
+import streamlit as st
+
+import pipeline
+import snapshot
+
+logger = logging.getLogger(__name__)
+
+# Imported by the first script run, so this is as close to process start as
+# a Streamlit app can observe
+PROCESS_START = time.perf_counter()
+
+HEAVY_MODULES = ("pandas", "plotly.express", "plotly.graph_objects", "requests")
+
+
+class WarmUp:
+    def __init__(self):
+        self.timings = {}
+        self.snapshot_ready = threading.Event()
+        self._first_render_logged = False
+        self._thread = threading.Thread(target=self._run, name="tasker-warmup", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def _run(self):
+        try:
+            # The snapshot goes first; it is what the first viewer waits on
+            started = time.perf_counter()
+            found = snapshot.load_from_disk()
+            self.timings["snapshot"] = time.perf_counter() - started
+            logger.info("Warm snapshot %s in %.2fs", "loaded" if found else "not found", self.timings["snapshot"])
+        finally:
+            self.snapshot_ready.set()
+
+        started = time.perf_counter()
+        for name in HEAVY_MODULES:
+            importlib.import_module(name)
+        self.timings["imports"] = time.perf_counter() - started
+        logger.info("Heavy modules imported in %.2fs", self.timings["imports"])
+
+        frame, version = snapshot.latest()
+        if frame is not None:
+            started = time.perf_counter()
+            pipeline.publish(frame, version)
+            self.timings["precompute"] = time.perf_counter() - started
+
+    # Record the first complete render of the process (once)
+    def record_render(self, seconds):
+        if self._first_render_logged:
+            return
+        self._first_render_logged = True
+        self.timings["first_render"] = seconds
+        self.timings["startup"] = time.perf_counter() - PROCESS_START
+        logger.info("Cold start: first render %.2fs, %.2fs since process start", seconds, self.timings["startup"])
+
+    # One-line summary for the sidebar
+    def report(self, render_seconds):
+        parts = [f"this run {render_seconds:.2f}s"]
+        if "startup" in self.timings:
+            parts.append(f"cold start {self.timings['startup']:.2f}s")
+        if "imports" in self.timings:
+            parts.append(f"imports {self.timings['imports']:.2f}s")
+        if "snapshot" in self.timings:
+            parts.append(f"snapshot {self.timings['snapshot']:.2f}s")
+        if "precompute" in self.timings:
+            parts.append(f"precompute {self.timings['precompute']:.2f}s")
+        return "⚡ " + " · ".join(parts)
+
+
+# Start warming up exactly once per process
+@st.cache_resource(show_spinner=False)
+def warm_start():
+    warm = WarmUp()
+    warm.start()
+    return warm